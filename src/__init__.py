@@ -12,9 +12,13 @@ __author__ = "Agent OS Team"
 __email__ = "agent-os@example.com"
 
 from .installer import AgentOsInstaller
+from .languages import detect_languages
+from .specs import SpecArchive
 from .cli import main as cli_main
 
 __all__ = [
     "AgentOsInstaller",
+    "detect_languages",
+    "SpecArchive",
     "cli_main",
 ]
@@ -17,6 +17,8 @@ from rich.text import Text
 from rich.table import Table
 
 from .installer import AgentOsInstaller
+from .languages import parse_languages
+from .specs import SpecArchive, parse_age
 
 console = Console()
 
@@ -43,9 +45,14 @@ def cli():
 @click.option('--overwrite-instructions', is_flag=True, help='Overwrite existing instruction files')
 @click.option('--overwrite-standards', is_flag=True, help='Overwrite existing standards files')
 @click.option('--overwrite-config', is_flag=True, help='Overwrite existing config files')
+@click.option('--languages', help='Comma-separated languages for code style guides '
+              '(python, javascript, html, css); detected from the project by default')
+@click.option('--all-standards', is_flag=True, help='Install code style guides for all languages')
+@click.option('--redetect', is_flag=True, help='Ignore the cached language detection result')
 def install(project_dir: str, claude_code: bool, cursor: bool, github_copilot: bool,
            qwen_code: bool, adk: bool, all_platforms: bool, overwrite_instructions: bool,
-           overwrite_standards: bool, overwrite_config: bool):
+           overwrite_standards: bool, overwrite_config: bool, languages: Optional[str],
+           all_standards: bool, redetect: bool):
     """Install Agent OS in a project directory.
     
     This command installs Agent OS directly in your project directory,
@@ -58,6 +65,9 @@ def install(project_dir: str, claude_code: bool, cursor: bool, github_copilot: b
         
         # Install specific platforms in a project
         agent-os install /path/to/project --claude-code --cursor
+        
+        # Install only the Python code style guide
+        agent-os install --all --languages python
     """
     # Set up installer
     installer = AgentOsInstaller()
@@ -87,6 +97,16 @@ def install(project_dir: str, claude_code: bool, cursor: bool, github_copilot: b
         config=overwrite_config
     )
     
+    # Set code style languages
+    if languages and all_standards:
+        raise click.UsageError("--languages cannot be combined with --all-standards")
+    try:
+        installer.set_languages(parse_languages(languages), slim=not all_standards,
+                                redetect=redetect)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    
     # Perform installation
     project_path = Path(project_dir).resolve()
     
@@ -171,6 +191,117 @@ def status(project_dir: str):
     console.print(table)
 
 
+@cli.group()
+def specs():
+    """Manage specs in .agent-os/specs/, including the spec archive."""
+    pass
+
+
+@specs.command('archive')
+@click.option('--project-dir', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              default='.', help='Project directory')
+@click.option('--older-than', default='90d', show_default=True,
+              help='Only archive specs older than this age (e.g. 90d, 12w)')
+@click.option('--dry-run', is_flag=True, help='List the specs that would be archived')
+def specs_archive(project_dir: str, older_than: str, dry_run: bool):
+    """Move completed specs into the compressed spec archive.
+
+    A spec is archived when all tasks in its tasks.md are checked and both
+    its folder date and the last change to its tasks.md are older than
+    --older-than.
+
+    Examples:
+        agent-os specs archive --older-than 90d
+        agent-os specs archive --project-dir /path/to/project --dry-run
+    """
+    archive = SpecArchive(Path(project_dir).resolve())
+
+    try:
+        names = archive.archivable(parse_age(older_than))
+        if not names:
+            console.print("[yellow]No completed specs to archive[/yellow]")
+            return
+        if not dry_run:
+            archive.archive(names)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+    table = Table(title="Specs to archive" if dry_run else "Archived specs")
+    table.add_column("Spec", style="cyan")
+    for name in names:
+        table.add_row(name)
+    console.print(table)
+    if not dry_run:
+        console.print(f"[green]✓ Archived {len(names)} spec(s) to {archive.archive_path}[/green]")
+
+
+@specs.command('list')
+@click.option('--project-dir', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              default='.', help='Project directory')
+def specs_list(project_dir: str):
+    """List live and archived specs."""
+    archive = SpecArchive(Path(project_dir).resolve())
+
+    table = Table(title="Specs")
+    table.add_column("Spec", style="cyan")
+    table.add_column("Location", style="white")
+    for name in archive.live_specs():
+        table.add_row(name, "live")
+    for name in archive.archived_specs():
+        table.add_row(name, "archived")
+    console.print(table)
+
+
+@specs.command('show')
+@click.argument('name')
+@click.option('--project-dir', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              default='.', help='Project directory')
+@click.option('--file', 'file_name', default='spec.md', show_default=True,
+              help='File within the spec folder to show')
+@click.option('--list', 'list_files', is_flag=True, help='List the files in the spec')
+def specs_show(name: str, project_dir: str, file_name: str, list_files: bool):
+    """Show a spec file, reading from the archive if the spec is archived.
+
+    NAME is the spec folder name or the spec name without its date prefix.
+
+    Examples:
+        agent-os specs show user-auth
+        agent-os specs show 2025-01-15-user-auth --file tasks.md
+    """
+    archive = SpecArchive(Path(project_dir).resolve())
+
+    try:
+        if list_files:
+            for file in archive.list_files(name):
+                click.echo(file)
+        else:
+            click.echo(archive.read(name, file_name), nl=False)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@specs.command('restore')
+@click.argument('name')
+@click.option('--project-dir', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              default='.', help='Project directory')
+def specs_restore(name: str, project_dir: str):
+    """Restore an archived spec to .agent-os/specs/.
+
+    NAME is the spec folder name or the spec name without its date prefix.
+    """
+    archive = SpecArchive(Path(project_dir).resolve())
+
+    try:
+        restored = archive.restore(name)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+    console.print(f"[green]✓ Restored {restored} to {archive.specs_dir / restored}[/green]")
+
+
 def main():
     """Main entry point for the CLI."""
     try:
@@ -8,6 +8,7 @@ Agent OS files from the local repository to target project directories.
 from __future__ import annotations
 
 import os
+import re
 import sys
 import shutil
 from pathlib import Path
@@ -17,8 +18,41 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich.text import Text
 
+from .languages import detect_languages
+
 console = Console()
 
+# Languages covered by each task-condition block of standards/code-style.md
+CODE_STYLE_BLOCKS = {
+    'html-css-tailwind': ('html', 'css'),
+    'javascript': ('javascript',),
+    'python': ('python',),
+}
+
+_CONDITIONAL_BLOCK = re.compile(
+    r'<conditional-block task-condition="([^"]+)"[^>]*>.*?</conditional-block>\n*',
+    re.DOTALL,
+)
+
+
+def trim_code_style(content: str, languages: List[str]) -> str:
+    """Drop code-style.md blocks for languages the project does not use.
+
+    Args:
+        content: Contents of code-style.md
+        languages: Languages detected in the project
+
+    Returns:
+        Trimmed code-style.md contents
+    """
+    def keep(match: re.Match) -> str:
+        block_languages = CODE_STYLE_BLOCKS.get(match.group(1))
+        if block_languages is None or set(block_languages) & set(languages):
+            return match.group(0)
+        return ''
+
+    return _CONDITIONAL_BLOCK.sub(keep, content).rstrip('\n') + '\n'
+
 
 class AgentOsInstaller:
     """Agent OS installer that copies files from the local repository."""
@@ -28,6 +62,9 @@ class AgentOsInstaller:
         self.overwrite_instructions = False
         self.overwrite_standards = False
         self.overwrite_config = False
+        self.slim_standards = True
+        self.languages: Optional[List[str]] = None
+        self.redetect_languages = False
         self.platforms = {
             'claude_code': False,
             'cursor': False,
@@ -59,7 +96,50 @@ class AgentOsInstaller:
         self.overwrite_standards = standards
         self.overwrite_config = config
         
-            
+    def set_languages(self, languages: Optional[List[str]] = None, slim: bool = True,
+                      redetect: bool = False) -> None:
+        """Set the languages used to slim the installed standards.
+        
+        Args:
+            languages: Project languages, or None to detect them from the project
+            slim: Install only the code style guides for the project's languages
+            redetect: Ignore the cached language detection result
+        """
+        self.languages = languages
+        self.slim_standards = slim
+        self.redetect_languages = redetect
+        
+    def _slim_standards(self, project_dir: Path, standards_dir: Path) -> None:
+        """Remove code style guides the project does not need and trim code-style.md.
+        
+        Args:
+            project_dir: Project directory used for language detection
+            standards_dir: Installed standards directory
+        """
+        languages = self.languages
+        if languages is None:
+            languages = detect_languages(project_dir, refresh=self.redetect_languages)
+        if not languages:
+            console.print("[yellow]No known languages detected; installing all code style guides[/yellow]")
+            return
+        
+        kept_guides = set()
+        for block_languages in CODE_STYLE_BLOCKS.values():
+            if set(block_languages) & set(languages):
+                kept_guides.update(f"{language}-style.md" for language in block_languages)
+        
+        style_dir = standards_dir / 'code-style'
+        if style_dir.is_dir():
+            for guide in style_dir.glob('*-style.md'):
+                if guide.name not in kept_guides:
+                    guide.unlink()
+        
+        index_file = standards_dir / 'code-style.md'
+        if index_file.exists():
+            index_file.write_text(trim_code_style(index_file.read_text(encoding='utf-8'), languages),
+                                  encoding='utf-8')
+        
+        console.print(f"[green]✓ Installed code style guides for: {', '.join(languages)}[/green]")
         
     def install(self, project_dir: Path) -> bool:
         """Install Agent OS directly in a project directory.
@@ -148,6 +228,9 @@ class AgentOsInstaller:
                     
                 progress.advance(task)
                 
+        if self.slim_standards:
+            self._slim_standards(project_dir, project_dir / '.agent-os/standards/')
+            
         console.print("[green]✓ Agent OS installation completed![/green]")
         return True
         
@@ -0,0 +1,228 @@
+"""
+Agent OS Repository Language Detection
+
+This module detects which languages a project uses so the installer only
+ships the code style guides that are relevant to it. Detection is a bounded,
+parallel scan of file extensions and manifest files, and its result is cached
+in the project's `.agent-os/` folder.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# Languages that have a style guide in standards/code-style/
+LANGUAGES = ('python', 'javascript', 'html', 'css')
+
+CACHE_FILE = Path('.agent-os/cache/languages.json')
+
+MANIFESTS: Dict[str, Tuple[str, ...]] = {
+    'pyproject.toml': ('python',),
+    'setup.py': ('python',),
+    'setup.cfg': ('python',),
+    'requirements.txt': ('python',),
+    'Pipfile': ('python',),
+    'package.json': ('javascript',),
+    'tsconfig.json': ('javascript',),
+    'tailwind.config.js': ('css',),
+    'tailwind.config.ts': ('css',),
+}
+
+EXTENSIONS: Dict[str, Tuple[str, ...]] = {
+    '.py': ('python',),
+    '.pyi': ('python',),
+    '.js': ('javascript',),
+    '.mjs': ('javascript',),
+    '.cjs': ('javascript',),
+    '.jsx': ('javascript', 'html'),
+    '.ts': ('javascript',),
+    '.tsx': ('javascript', 'html'),
+    '.vue': ('javascript', 'html', 'css'),
+    '.svelte': ('javascript', 'html', 'css'),
+    '.html': ('html',),
+    '.htm': ('html',),
+    '.erb': ('html',),
+    '.css': ('css',),
+    '.scss': ('css',),
+    '.sass': ('css',),
+    '.less': ('css',),
+}
+
+IGNORED_DIRS = {
+    '.git', '.hg', '.svn', '.agent-os', '.claude', '.cursor', '.github', '.qwen', '.adk',
+    'node_modules', 'bower_components', 'vendor', '.venv', 'venv', 'env',
+    '__pycache__', '.mypy_cache', '.pytest_cache', '.tox', '.nox',
+    'build', 'dist', 'site-packages', 'target', 'coverage',
+}
+
+MAX_FILES = 20000
+MAX_DEPTH = 8
+MAX_WORKERS = 8
+
+
+def _classify(file_name: str) -> Tuple[str, ...]:
+    """Return the languages indicated by a single file name."""
+    if file_name in MANIFESTS:
+        return MANIFESTS[file_name]
+    return EXTENSIONS.get(os.path.splitext(file_name)[1].lower(), ())
+
+
+class _ScanBudget:
+    """File budget and results shared by all scan workers."""
+
+    def __init__(self, project_dir: Path, max_files: int):
+        self.project_dir = project_dir
+        self.remaining = max_files
+        self.found: Set[str] = set()
+        self.visited: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def visit(self, directory: Path) -> List[os.DirEntry]:
+        """List a directory and record its modification time."""
+        mtime = os.stat(directory).st_mtime_ns
+        entries = list(os.scandir(directory))
+        with self.lock:
+            self.visited[directory.relative_to(self.project_dir).as_posix()] = mtime
+        return entries
+
+    def record(self, languages: Tuple[str, ...]) -> bool:
+        """Record one scanned file; return False once the scan should stop."""
+        with self.lock:
+            self.remaining -= 1
+            self.found.update(languages)
+            return self.remaining > 0 and len(self.found) < len(LANGUAGES)
+
+
+def _scan_tree(root: Path, budget: _ScanBudget) -> None:
+    """Walk a directory tree until it is exhausted or the budget runs out."""
+    stack = [(root, 0)]
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            entries = budget.visit(directory)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if depth < MAX_DEPTH and entry.name not in IGNORED_DIRS:
+                    stack.append((Path(entry.path), depth + 1))
+            elif not budget.record(_classify(entry.name)):
+                return
+
+
+def _scan(project_dir: Path, max_files: int) -> _ScanBudget:
+    """Scan a project and return the shared scan state."""
+    budget = _ScanBudget(project_dir, max_files)
+    subdirs = []
+    try:
+        entries = budget.visit(project_dir)
+    except OSError:
+        entries = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in IGNORED_DIRS:
+                subdirs.append(Path(entry.path))
+        else:
+            budget.record(_classify(entry.name))
+
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(subdirs))) as executor:
+            list(executor.map(lambda d: _scan_tree(d, budget), subdirs))
+    return budget
+
+
+def scan_languages(project_dir: Path, max_files: int = MAX_FILES) -> List[str]:
+    """Scan a project for the languages it uses, without caching.
+
+    Files directly in the project root (including manifests such as
+    pyproject.toml and package.json) are classified first, then each
+    top-level directory is walked in a worker thread. The scan stops after
+    `max_files` files or once every known language has been seen.
+
+    Args:
+        project_dir: Project directory to scan
+        max_files: Maximum number of files to inspect
+
+    Returns:
+        Detected languages, in the order of LANGUAGES
+    """
+    found = _scan(project_dir, max_files).found
+    return [language for language in LANGUAGES if language in found]
+
+
+def _is_unchanged(project_dir: Path, visited: Dict[str, int]) -> bool:
+    """Check that no directory seen by a previous scan has been modified."""
+    for directory, mtime in visited.items():
+        try:
+            if os.stat(project_dir / directory).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def detect_languages(project_dir: Path, use_cache: bool = True,
+                     refresh: bool = False) -> List[str]:
+    """Detect the languages a project uses, reusing a cached result if valid.
+
+    The cache in `.agent-os/cache/languages.json` records the modification
+    time of every directory the scan visited, and is invalidated as soon as
+    a file is added to, removed from or renamed in any of them.
+
+    Args:
+        project_dir: Project directory to scan
+        use_cache: Read and write the on-disk cache
+        refresh: Ignore any cached result, rescan and rewrite the cache
+
+    Returns:
+        Detected languages, in the order of LANGUAGES
+    """
+    cache_file = project_dir / CACHE_FILE
+
+    if use_cache and not refresh and cache_file.is_file():
+        try:
+            cached = json.loads(cache_file.read_text(encoding='utf-8'))
+            if cached['visited'] and _is_unchanged(project_dir, cached['visited']):
+                return [language for language in LANGUAGES if language in cached['languages']]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    if use_cache:
+        # Create the cache folder first so creating it does not change the
+        # mtime of a directory the scan is about to record
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            use_cache = False
+
+    budget = _scan(project_dir, MAX_FILES)
+    languages = [language for language in LANGUAGES if language in budget.found]
+
+    if use_cache:
+        try:
+            cache_file.write_text(json.dumps({'languages': languages, 'visited': budget.visited}),
+                                  encoding='utf-8')
+        except OSError:
+            pass
+    return languages
+
+
+def parse_languages(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated language list such as ``python,css``.
+
+    Raises:
+        ValueError: If a language has no style guide
+    """
+    if not value:
+        return None
+    languages = [part.strip().lower() for part in value.split(',') if part.strip()]
+    unknown = [language for language in languages if language not in LANGUAGES]
+    if unknown:
+        raise ValueError(f"Unknown language(s): {', '.join(unknown)} "
+                         f"(expected any of {', '.join(LANGUAGES)})")
+    return [language for language in LANGUAGES if language in languages]
@@ -0,0 +1,306 @@
+"""
+Agent OS Spec Archive
+
+This module compacts completed spec folders from `.agent-os/specs/` into a
+single compressed archive so the live specs tree stays small and fast to scan.
+Archived specs can still be read in place or restored to the live tree.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import zipfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+SPECS_DIR = Path('.agent-os/specs')
+ARCHIVE_FILE = Path('.agent-os/specs-archive.zip')
+
+_SPEC_DATE = re.compile(r'^(\d{4}-\d{2}-\d{2})-')
+_OPEN_TASK = re.compile(r'^\s*[-*]\s+\[ \]', re.MULTILINE)
+_DONE_TASK = re.compile(r'^\s*[-*]\s+\[[xX]\]', re.MULTILINE)
+_AGE = re.compile(r'^(\d+)\s*([dw]?)$')
+
+
+def parse_age(value: str) -> int:
+    """Parse an age such as ``90d``, ``12w`` or ``30`` into a number of days.
+
+    Args:
+        value: Age string; a bare number is taken as days
+
+    Returns:
+        Number of days
+
+    Raises:
+        ValueError: If the value is not a valid age
+    """
+    match = _AGE.match(value.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid age '{value}' (expected e.g. 90d or 12w)")
+    count, unit = int(match.group(1)), match.group(2)
+    return count * 7 if unit == 'w' else count
+
+
+def spec_date(name: str) -> Optional[date]:
+    """Return the creation date encoded in a YYYY-MM-DD-spec-name folder name."""
+    match = _SPEC_DATE.match(name)
+    if not match:
+        return None
+    try:
+        return date.fromisoformat(match.group(1))
+    except ValueError:
+        return None
+
+
+def is_spec_complete(spec_dir: Path) -> bool:
+    """Check whether every task in a spec's tasks.md is checked off.
+
+    A spec without a tasks.md, or with no tasks at all, is never complete.
+    """
+    tasks_file = spec_dir / 'tasks.md'
+    if not tasks_file.is_file():
+        return False
+    content = tasks_file.read_text(encoding='utf-8')
+    return bool(_DONE_TASK.search(content)) and not _OPEN_TASK.search(content)
+
+
+class SpecArchive:
+    """Compressed, randomly accessible archive of completed spec folders.
+
+    Specs are stored as deflated members of a single zip file whose central
+    directory serves as the index, so one spec file can be read without
+    decompressing the rest of the archive.
+    """
+
+    def __init__(self, project_dir: Path):
+        """Initialize the archive for a project.
+
+        Args:
+            project_dir: Project directory containing `.agent-os/`
+        """
+        self.project_dir = project_dir
+        self.specs_dir = project_dir / SPECS_DIR
+        self.archive_path = project_dir / ARCHIVE_FILE
+
+    def live_specs(self) -> List[str]:
+        """Return the names of spec folders in the live specs tree."""
+        if not self.specs_dir.is_dir():
+            return []
+        return sorted(p.name for p in self.specs_dir.iterdir() if p.is_dir())
+
+    def archived_specs(self) -> List[str]:
+        """Return the names of specs stored in the archive."""
+        if not self.archive_path.is_file():
+            return []
+        with zipfile.ZipFile(self.archive_path) as zf:
+            return sorted({n.split('/', 1)[0] for n in zf.namelist() if '/' in n})
+
+    def archivable(self, older_than_days: int, today: Optional[date] = None) -> List[str]:
+        """Return completed live specs untouched for more than `older_than_days`.
+
+        A spec's age is measured from the later of the date in its folder name
+        and the modification time of its tasks.md, so a spec that was restored
+        or worked on recently is not archived again straight away.
+
+        Args:
+            older_than_days: Minimum spec age in days
+            today: Reference date, defaults to the current date
+
+        Returns:
+            Names of specs eligible for archiving
+        """
+        cutoff = (today or date.today()) - timedelta(days=older_than_days)
+        names = []
+        for name in self.live_specs():
+            created = spec_date(name)
+            if created is None or created > cutoff:
+                continue
+            spec_dir = self.specs_dir / name
+            if not is_spec_complete(spec_dir):
+                continue
+            modified = date.fromtimestamp((spec_dir / 'tasks.md').stat().st_mtime)
+            if modified <= cutoff:
+                names.append(name)
+        return names
+
+    def archive(self, names: List[str]) -> List[str]:
+        """Move spec folders from the live tree into the archive.
+
+        New members are added to a temporary copy of the archive, which only replaces the
+        existing one once every new member has been written and verified, so
+        a failure leaves both the archive and the live folders untouched.
+
+        Args:
+            names: Spec folder names to archive
+
+        Returns:
+            Names of the specs that were archived
+
+        Raises:
+            FileNotFoundError: If a spec folder does not exist
+            FileExistsError: If a spec is already in the archive
+        """
+        if not names:
+            return []
+        already_archived = set(self.archived_specs())
+        for name in names:
+            if not (self.specs_dir / name).is_dir():
+                raise FileNotFoundError(f"Spec '{name}' not found in {self.specs_dir}")
+            if name in already_archived:
+                raise FileExistsError(f"Spec '{name}' is already archived")
+
+        # Build the new archive next to the old one so a failure leaves it untouched
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.archive_path.with_suffix('.zip.tmp')
+        tmp_path.unlink(missing_ok=True)
+        try:
+            if self.archive_path.is_file():
+                shutil.copyfile(self.archive_path, tmp_path)
+            with zipfile.ZipFile(tmp_path, 'a', compression=zipfile.ZIP_DEFLATED) as dst:
+                for name in names:
+                    spec_dir = self.specs_dir / name
+                    for root, _, files in os.walk(spec_dir):
+                        for file in sorted(files):
+                            path = Path(root) / file
+                            dst.write(path, f"{name}/{path.relative_to(spec_dir).as_posix()}")
+
+            # Reading a member back checks its CRC; only the new members are verified
+            prefixes = tuple(f"{name}/" for name in names)
+            with zipfile.ZipFile(tmp_path) as zf:
+                for member in zf.namelist():
+                    if member.startswith(prefixes):
+                        zf.read(member)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        tmp_path.replace(self.archive_path)
+
+        for name in names:
+            shutil.rmtree(self.specs_dir / name)
+        return list(names)
+
+    def resolve(self, name: str) -> str:
+        """Resolve a spec reference to a full spec folder name.
+
+        Accepts either the full `YYYY-MM-DD-spec-name` folder name or just the
+        `spec-name` part, looking in both the live tree and the archive.
+
+        Raises:
+            FileNotFoundError: If no spec matches
+            ValueError: If the short name matches more than one spec
+        """
+        candidates = set(self.live_specs()) | set(self.archived_specs())
+        if name in candidates:
+            return name
+        matches = sorted(c for c in candidates if _SPEC_DATE.sub('', c) == name)
+        if not matches:
+            raise FileNotFoundError(f"Spec '{name}' not found")
+        if len(matches) > 1:
+            raise ValueError(f"Spec '{name}' is ambiguous: {', '.join(matches)}")
+        return matches[0]
+
+    def list_files(self, name: str) -> List[str]:
+        """List the files of a spec, whether live or archived."""
+        name = self.resolve(name)
+        files = set()
+        spec_dir = self.specs_dir / name
+        if spec_dir.is_dir():
+            files.update(p.relative_to(spec_dir).as_posix()
+                         for p in spec_dir.rglob('*') if p.is_file())
+        if name in self.archived_specs():
+            prefix = f"{name}/"
+            with zipfile.ZipFile(self.archive_path) as zf:
+                files.update(n[len(prefix):] for n in zf.namelist()
+                             if n.startswith(prefix) and not n.endswith('/'))
+        return sorted(files)
+
+    def read(self, name: str, file: str = 'spec.md') -> str:
+        """Read a file from a spec, transparently falling back to the archive.
+
+        The live file is preferred; if it is missing and the spec is also
+        archived, the archived copy is returned instead.
+
+        Args:
+            name: Spec folder name or short spec name
+            file: Path of the file within the spec folder
+
+        Returns:
+            File contents
+
+        Raises:
+            FileNotFoundError: If the spec or file does not exist
+        """
+        name = self.resolve(name)
+        live_file = self.specs_dir / name / file
+        if live_file.is_file():
+            return live_file.read_text(encoding='utf-8')
+        if name in self.archived_specs():
+            with zipfile.ZipFile(self.archive_path) as zf:
+                try:
+                    return zf.read(f"{name}/{file}").decode('utf-8')
+                except KeyError:
+                    pass
+        raise FileNotFoundError(f"File '{file}' not found in spec '{name}'")
+
+    def restore(self, name: str) -> str:
+        """Move an archived spec back into the live specs tree.
+
+        The reduced archive is built and verified in a temporary file and the
+        spec is extracted into a staging folder next to the specs tree before
+        anything is moved into place, so a failure leaves the archive and the
+        live tree untouched.
+
+        Args:
+            name: Spec folder name or short spec name
+
+        Returns:
+            Full name of the restored spec
+
+        Raises:
+            FileNotFoundError: If the spec is not in the archive
+            FileExistsError: If the spec already exists in the live tree
+        """
+        name = self.resolve(name)
+        if name not in self.archived_specs():
+            raise FileNotFoundError(f"Spec '{name}' is not archived")
+        spec_dir = self.specs_dir / name
+        if spec_dir.exists():
+            raise FileExistsError(f"Spec '{name}' already exists in {self.specs_dir}")
+
+        prefix = f"{name}/"
+        tmp_path = self.archive_path.with_suffix('.zip.tmp')
+        staging_dir = self.specs_dir.parent / f".restore-{name}"
+        tmp_path.unlink(missing_ok=True)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        try:
+            with zipfile.ZipFile(self.archive_path) as src:
+                remaining = [info for info in src.infolist()
+                             if not info.filename.startswith(prefix)]
+                if remaining:
+                    with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as dst:
+                        for info in remaining:
+                            dst.writestr(info, src.read(info))
+                    with zipfile.ZipFile(tmp_path) as zf:
+                        bad_member = zf.testzip()
+                        if bad_member is not None:
+                            raise zipfile.BadZipFile(f"Archive verification failed at {bad_member}")
+                for info in src.infolist():
+                    if info.filename.startswith(prefix):
+                        src.extract(info, staging_dir)
+
+            self.specs_dir.mkdir(parents=True, exist_ok=True)
+            (staging_dir / name).rename(spec_dir)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+        if remaining:
+            tmp_path.replace(self.archive_path)
+        else:
+            self.archive_path.unlink()
+        return name
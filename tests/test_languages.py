@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for Agent OS repository language detection.
+
+This script tests language detection and code style slimming in
+temporary project directories.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the src package to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.languages as languages_module
+from src.languages import CACHE_FILE, detect_languages, parse_languages, scan_languages
+from src.installer import AgentOsInstaller, trim_code_style
+
+
+def test_manifest_and_extension_detection():
+    """Test detection from manifests and file extensions."""
+    print("Testing language detection...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        (project_dir / "pyproject.toml").write_text("[project]\n")
+        assert scan_languages(project_dir) == ["python"]
+
+        (project_dir / "web" / "static").mkdir(parents=True)
+        (project_dir / "web" / "static" / "site.css").write_text("")
+        (project_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (project_dir / "node_modules" / "pkg" / "index.js").write_text("")
+        assert scan_languages(project_dir) == ["python", "css"]
+
+    print("✓ Language detection test passed")
+
+
+def test_detection_cache():
+    """Test that the detection result is cached and invalidated."""
+    print("Testing language detection cache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        (project_dir / "setup.py").write_text("")
+
+        scan_calls = []
+        original_scan = languages_module._scan
+
+        def counting_scan(*args, **kwargs):
+            scan_calls.append(args)
+            return original_scan(*args, **kwargs)
+
+        languages_module._scan = counting_scan
+        try:
+            assert detect_languages(project_dir) == ["python"]
+            assert (project_dir / CACHE_FILE).is_file()
+            assert detect_languages(project_dir) == ["python"]
+            assert len(scan_calls) == 1, "Unchanged tree should be served from the cache"
+        finally:
+            languages_module._scan = original_scan
+
+        (project_dir / "package.json").write_text("{}")
+        assert detect_languages(project_dir) == ["python", "javascript"]
+
+    print("✓ Language detection cache test passed")
+
+
+def test_detection_cache_nested_change():
+    """Test that files added deep in the tree invalidate the cache."""
+    print("Testing language detection cache with nested changes...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        (project_dir / "pyproject.toml").write_text("[project]\n")
+        (project_dir / "src" / "pkg").mkdir(parents=True)
+        (project_dir / "src" / "pkg" / "a.py").write_text("")
+        assert detect_languages(project_dir) == ["python"]
+
+        (project_dir / "src" / "pkg" / "web").mkdir()
+        (project_dir / "src" / "pkg" / "web" / "app.js").write_text("")
+        (project_dir / "src" / "pkg" / "web" / "s.css").write_text("")
+        assert detect_languages(project_dir) == ["python", "javascript", "css"]
+        assert detect_languages(project_dir, refresh=True) == ["python", "javascript", "css"]
+
+    print("✓ Language detection cache with nested changes test passed")
+
+
+def test_parse_languages():
+    """Test parsing of --languages values."""
+    print("Testing language list parsing...")
+
+    assert parse_languages(None) is None
+    assert parse_languages("css, Python") == ["python", "css"]
+    try:
+        parse_languages("ruby")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Language list parsing test passed")
+
+
+def test_trim_code_style():
+    """Test that code-style.md keeps only relevant language blocks."""
+    print("Testing code-style.md trimming...")
+
+    source = Path(__file__).parent.parent / "standards" / "code-style.md"
+    trimmed = trim_code_style(source.read_text(), ["python"])
+
+    assert 'context-check="general-formatting"' in trimmed
+    assert 'task-condition="python"' in trimmed
+    assert 'task-condition="javascript"' not in trimmed
+    assert 'task-condition="html-css-tailwind"' not in trimmed
+
+    print("✓ code-style.md trimming test passed")
+
+
+def test_install_slims_standards():
+    """Test that install only ships style guides for detected languages."""
+    print("Testing standards slimming on install...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        (project_dir / "pyproject.toml").write_text("[project]\n")
+
+        installer = AgentOsInstaller()
+        assert installer.install(project_dir)
+
+        style_dir = project_dir / ".agent-os" / "standards" / "code-style"
+        assert sorted(p.name for p in style_dir.iterdir()) == ["python-style.md"]
+        index = (project_dir / ".agent-os" / "standards" / "code-style.md").read_text()
+        assert "javascript-style.md" not in index
+
+    print("✓ Standards slimming on install test passed")
+
+
+def main():
+    """Run all tests."""
+    print("Running Agent OS language detection tests...\n")
+
+    try:
+        test_manifest_and_extension_detection()
+        test_detection_cache()
+        test_detection_cache_nested_change()
+        test_parse_languages()
+        test_trim_code_style()
+        test_install_slims_standards()
+
+        print("\n🎉 All tests passed!")
+        return 0
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
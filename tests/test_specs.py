@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Test script for the Agent OS spec archive.
+
+This script tests archiving, reading and restoring specs in a
+temporary project directory.
+"""
+
+import os
+import sys
+import tempfile
+import zipfile
+from datetime import date, datetime
+from pathlib import Path
+
+# Add the src package to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.specs import SpecArchive, parse_age, is_spec_complete
+
+DONE_TASKS = "# Spec Tasks\n\n- [x] 1. Build it\n  - [x] 1.1 Write tests\n"
+OPEN_TASKS = "# Spec Tasks\n\n- [x] 1. Build it\n  - [ ] 1.1 Write tests\n"
+
+
+def make_spec(project_dir: Path, name: str, tasks: str) -> Path:
+    """Create a spec folder with spec.md, a sub-spec and tasks.md."""
+    spec_dir = project_dir / ".agent-os" / "specs" / name
+    (spec_dir / "sub-specs").mkdir(parents=True)
+    (spec_dir / "spec.md").write_text(f"# Spec {name}\n")
+    (spec_dir / "sub-specs" / "technical-spec.md").write_text("# Technical\n")
+    (spec_dir / "tasks.md").write_text(tasks)
+    if name[:10].replace("-", "").isdigit():
+        # Make tasks.md as old as the spec's folder date
+        timestamp = datetime.strptime(name[:10], "%Y-%m-%d").timestamp()
+        os.utime(spec_dir / "tasks.md", (timestamp, timestamp))
+    return spec_dir
+
+
+def test_parse_age():
+    """Test age parsing."""
+    print("Testing age parsing...")
+
+    assert parse_age("90d") == 90
+    assert parse_age("12w") == 84
+    assert parse_age("30") == 30
+    try:
+        parse_age("3 months")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Age parsing test passed")
+
+
+def test_archivable_selection():
+    """Test that only old, completed specs are selected."""
+    print("Testing archivable spec selection...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        make_spec(project_dir, "2025-01-10-old-done", DONE_TASKS)
+        make_spec(project_dir, "2025-01-11-old-open", OPEN_TASKS)
+        make_spec(project_dir, "2025-06-01-new-done", DONE_TASKS)
+        make_spec(project_dir, "undated-done", DONE_TASKS)
+        touched = make_spec(project_dir, "2025-01-09-old-touched", DONE_TASKS)
+        os.utime(touched / "tasks.md", None)
+
+        assert is_spec_complete(project_dir / ".agent-os/specs/2025-01-10-old-done")
+        assert not is_spec_complete(project_dir / ".agent-os/specs/2025-01-11-old-open")
+
+        archive = SpecArchive(project_dir)
+        assert archive.archivable(90, today=date(2025, 6, 10)) == ["2025-01-10-old-done"]
+
+    print("✓ Archivable spec selection test passed")
+
+
+def test_archive_show_restore():
+    """Test archiving, reading from the archive and restoring a spec."""
+    print("Testing archive, show and restore...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        make_spec(project_dir, "2025-01-10-user-auth", DONE_TASKS)
+        make_spec(project_dir, "2025-01-12-billing", DONE_TASKS)
+        archive = SpecArchive(project_dir)
+
+        archived = archive.archive(archive.archivable(90, today=date(2025, 6, 10)))
+        assert archived == ["2025-01-10-user-auth", "2025-01-12-billing"]
+        assert archive.live_specs() == []
+        assert archive.archived_specs() == archived
+        assert archive.archive_path.is_file()
+
+        assert archive.read("user-auth") == "# Spec 2025-01-10-user-auth\n"
+        assert archive.read("user-auth", "sub-specs/technical-spec.md") == "# Technical\n"
+        assert archive.list_files("billing") == [
+            "spec.md", "sub-specs/technical-spec.md", "tasks.md"]
+
+        assert archive.restore("user-auth") == "2025-01-10-user-auth"
+        assert archive.live_specs() == ["2025-01-10-user-auth"]
+        assert archive.archived_specs() == ["2025-01-12-billing"]
+        assert archive.read("user-auth", "tasks.md") == DONE_TASKS
+
+        # A restored spec counts as recently modified and is not re-archived
+        assert archive.archivable(90, today=date.today()) == []
+
+        archive.restore("billing")
+        assert not archive.archive_path.exists()
+
+    print("✓ Archive, show and restore test passed")
+
+
+def test_restore_refuses_to_overwrite():
+    """Test that restore does not overwrite a live spec."""
+    print("Testing restore overwrite protection...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        make_spec(project_dir, "2025-01-10-user-auth", DONE_TASKS)
+        archive = SpecArchive(project_dir)
+        archive.archive(["2025-01-10-user-auth"])
+        make_spec(project_dir, "2025-01-10-user-auth", OPEN_TASKS)
+
+        try:
+            archive.restore("2025-01-10-user-auth")
+            assert False, "Expected FileExistsError"
+        except FileExistsError:
+            pass
+        assert archive.archived_specs() == ["2025-01-10-user-auth"]
+
+    print("✓ Restore overwrite protection test passed")
+
+
+def test_archive_failure_leaves_archive_unchanged():
+    """Test that a failed archive run does not leave partial members behind."""
+    print("Testing archive write failure...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        make_spec(project_dir, "2025-01-10-user-auth", DONE_TASKS)
+        make_spec(project_dir, "2025-01-12-billing", DONE_TASKS)
+        archive = SpecArchive(project_dir)
+        archive.archive(["2025-01-10-user-auth"])
+        archive_before = archive.archive_path.read_bytes()
+
+        original_write = zipfile.ZipFile.write
+
+        def failing_write(self, filename, arcname=None, *args, **kwargs):
+            if str(arcname).endswith("tasks.md"):
+                raise OSError("No space left on device")
+            return original_write(self, filename, arcname, *args, **kwargs)
+
+        zipfile.ZipFile.write = failing_write
+        try:
+            archive.archive(["2025-01-12-billing"])
+            assert False, "Expected OSError"
+        except OSError:
+            pass
+        finally:
+            zipfile.ZipFile.write = original_write
+
+        assert archive.archive_path.read_bytes() == archive_before
+        assert not archive.archive_path.with_suffix(".zip.tmp").exists()
+        assert archive.archived_specs() == ["2025-01-10-user-auth"]
+        assert archive.live_specs() == ["2025-01-12-billing"]
+        assert archive.archive(["2025-01-12-billing"]) == ["2025-01-12-billing"]
+
+    print("✓ Archive write failure test passed")
+
+
+def test_restore_failure_leaves_archive_unchanged():
+    """Test that a failed restore leaves the spec archived and not live."""
+    print("Testing restore write failure...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        make_spec(project_dir, "2025-01-10-user-auth", DONE_TASKS)
+        make_spec(project_dir, "2025-01-12-billing", DONE_TASKS)
+        archive = SpecArchive(project_dir)
+        archive.archive(["2025-01-10-user-auth", "2025-01-12-billing"])
+        archive_before = archive.archive_path.read_bytes()
+
+        original_writestr = zipfile.ZipFile.writestr
+
+        def failing_writestr(self, *args, **kwargs):
+            raise OSError("No space left on device")
+
+        zipfile.ZipFile.writestr = failing_writestr
+        try:
+            archive.restore("user-auth")
+            assert False, "Expected OSError"
+        except OSError:
+            pass
+        finally:
+            zipfile.ZipFile.writestr = original_writestr
+
+        assert archive.archive_path.read_bytes() == archive_before
+        assert not archive.archive_path.with_suffix(".zip.tmp").exists()
+        assert sorted(p.name for p in (project_dir / ".agent-os").iterdir()) == [
+            "specs", "specs-archive.zip"]
+        assert archive.live_specs() == []
+        assert archive.restore("user-auth") == "2025-01-10-user-auth"
+
+    print("✓ Restore write failure test passed")
+
+
+def test_read_falls_back_to_archive():
+    """Test that a partial live folder does not hide archived files."""
+    print("Testing read fallback with a partial live folder...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        make_spec(project_dir, "2025-01-10-user-auth", DONE_TASKS)
+        archive = SpecArchive(project_dir)
+        archive.archive(["2025-01-10-user-auth"])
+
+        partial_dir = project_dir / ".agent-os" / "specs" / "2025-01-10-user-auth"
+        partial_dir.mkdir()
+        (partial_dir / "spec.md").write_text("# Partial\n")
+
+        assert archive.read("user-auth") == "# Partial\n"
+        assert archive.read("user-auth", "tasks.md") == DONE_TASKS
+        assert archive.list_files("user-auth") == [
+            "spec.md", "sub-specs/technical-spec.md", "tasks.md"]
+
+    print("✓ Read fallback with a partial live folder test passed")
+
+
+def main():
+    """Run all tests."""
+    print("Running Agent OS spec archive tests...\n")
+
+    try:
+        test_parse_age()
+        test_archivable_selection()
+        test_archive_show_restore()
+        test_restore_refuses_to_overwrite()
+        test_archive_failure_leaves_archive_unchanged()
+        test_restore_failure_leaves_archive_unchanged()
+        test_read_falls_back_to_archive()
+
+        print("\n🎉 All tests passed!")
+        return 0
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())